@@ -27,6 +27,9 @@
 
 """
 
+import array
+import functools
+import mmap
 import struct
 import sys
 
@@ -76,6 +79,22 @@ LOSS_MEASUREMENT_MAP = {
 }
 
 
+# All known combinations of the event, note and loss measurement technique
+# characters of an event type, so that interpret_event_type() needs only a
+# single lookup.
+#
+_EVENT_TYPE_TABLE = {
+    (event + note, technique): (
+        EVENT_MAP[event],
+        EVENT_NOTE_MAP[note],
+        LOSS_MEASUREMENT_MAP[technique],
+    )
+    for event in EVENT_MAP
+    for note in EVENT_NOTE_MAP
+    for technique in LOSS_MEASUREMENT_MAP
+}
+
+
 C_KM = 0.299792458
 """Speed of light in km/usec."""
 
@@ -83,89 +102,184 @@ C_M = C_KM * 1000
 """Speed of light in m/usec."""
 
 
-def read_zero_terminated_string(fp):
+# Pre-compiled structs so the format strings are parsed only once.
+#
+_U2 = struct.Struct("<H")
+_U4 = struct.Struct("<I")
+_S2 = struct.Struct("<h")
+_S4 = struct.Struct("<i")
+
+# Version, size and number of blocks following the name of the Map block.
+#
+_MAP_HEADER = struct.Struct("<HIH")
+
+# Version and size following the name of a Map block entry.
+#
+_MAP_ENTRY = struct.Struct("<HI")
+
+# Fixed-layout part of the FxdParams block following the block name.
+#
+_FXDPARAMS = struct.Struct("<I2sHiiHHIIIHIHIiiHhHHHH2siiii")
+
+# Header of the DataPts block between the block name and the data points.
+#
+_DATAPTS_HEADER = struct.Struct("<IHIH")
+
+# Fixed-layout part of a KeyEvents event preceding its comment.
+#
+_EVENT = struct.Struct("<HIhhi8sIIIII")
+
+# Summary following the events of the KeyEvents block.
+#
+_KEYEVENTS_SUMMARY = struct.Struct("<iiIHiI")
+
+
+class Cursor:
+    """Read position within the content of a SOR file.
+
+    All ``read_*()`` and ``parse_*_block()`` functions read from
+    ``buf`` at offset ``pos`` and advance ``pos`` past the bytes
+    they consumed.
+
+    Args:
+        buf (bytes): Content of the SOR file, typically a ``mmap``.
+        pos (int): Offset of the next byte to read.
+    """
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf, pos=0):
+        self.buf = buf
+        self.pos = pos
+
+
+def read_zero_terminated_string(cur):
     """Read until \0 and return as unicode string.
 
     Args:
-        fp (file): File object of the opened SOR file.
+        cur (Cursor): Read position within the SOR file.
 
     Returns:
         string: Read string, stripped off leading and trailing white space.
     """
 
-    s = bytes()
-    while True:
-        c = fp.read(1)
-        if c == b"\x00":
-            return s.strip()
-        s += bytes(c)
+    start = cur.pos
+    end = cur.buf.find(b"\x00", start)
+    if end < 0:
+        raise EOFError(f"Unterminated string at offset {start}")
+    cur.pos = end + 1
+    return cur.buf[start:end].strip()
 
 
-def read_fixed_length_string(fp, n):
+def read_fixed_length_string(cur, n):
     """Read fixed number of bytes and return as unicode string.
 
     Args:
-        fp (file): File object of the opened SOR file.
+        cur (Cursor): Read position within the SOR file.
         n (int): Number of bytes to read.
 
     Returns:
         unicode: Read unicode string, stripped off leading and trailing white space.
     """
 
-    return fp.read(n).decode().strip()
+    s = cur.buf[cur.pos:cur.pos + n]
+    cur.pos += n
+    return decode_fixed_length_string(s)
+
+
+@functools.lru_cache(maxsize=256)
+def decode_fixed_length_string(s):
+    """Decode a fixed length string field.
+
+    Fixed length fields hold short codes like "BC", "ST" or "0F9999LS"
+    with only a handful of distinct values per file, so the decoded
+    strings are cached.
+
+    Args:
+        s (bytes): Raw content of the field.
+
+    Returns:
+        unicode: Decoded unicode string, stripped off leading and trailing white space.
+    """
+
+    return s.decode().strip()
 
 
-def read_unsigned2(fp):
+def read_unsigned2(cur):
     """Read 2 bytes and return a little-endian unsigned integer.
 
     Args:
-        fp (file): File object of the opened SOR file.
+        cur (Cursor): Read position within the SOR file.
 
     Returns:
         int: The bytes read interpreted as an unsigned integer.
     """
 
-    return struct.unpack("<H", fp.read(2))[0]
+    value = _U2.unpack_from(cur.buf, cur.pos)[0]
+    cur.pos += 2
+    return value
 
 
-def read_unsigned4(fp):
+def read_unsigned4(cur):
     """Read 4 bytes and return a little-endian unsigned integer.
 
     Args:
-        fp (file): File object of the opened SOR file.
+        cur (Cursor): Read position within the SOR file.
 
     Returns:
         int: The bytes read interpreted as an unsigned integer.
 
     """
 
-    return struct.unpack("<I", fp.read(4))[0]
+    value = _U4.unpack_from(cur.buf, cur.pos)[0]
+    cur.pos += 4
+    return value
 
 
-def read_signed2(fp):
+def read_signed2(cur):
     """Read 2 bytes and return a little-endian signed integer.
 
     Args:
-        fp (file): File object of the opened SOR file.
+        cur (Cursor): Read position within the SOR file.
 
     Returns:
         int: The bytes read interpreted as a signed integer.
     """
 
-    return struct.unpack("<h", fp.read(2))[0]
+    value = _S2.unpack_from(cur.buf, cur.pos)[0]
+    cur.pos += 2
+    return value
 
 
-def read_signed4(fp):
+def read_signed4(cur):
     """Read 4 bytes and return a little-endian unsigned integer.
 
     Args:
-        fp (file): File object of the opened SOR file.
+        cur (Cursor): Read position within the SOR file.
 
     Returns:
         int: The bytes read interpreted as a signed integer.
     """
 
-    return struct.unpack("<i", fp.read(4))[0]
+    value = _S4.unpack_from(cur.buf, cur.pos)[0]
+    cur.pos += 4
+    return value
+
+
+def read_struct(cur, s):
+    """Read a fixed-layout record in a single unpack.
+
+    Args:
+        cur (Cursor): Read position within the SOR file.
+        s (struct.Struct): Layout of the record.
+
+    Returns:
+        tuple: The unpacked fields of the record.
+    """
+
+    values = s.unpack_from(cur.buf, cur.pos)
+    cur.pos += s.size
+    return values
 
 
 def interpret_event_type(event_type):
@@ -185,7 +299,7 @@ def interpret_event_type(event_type):
        x=O - Out of range.
        x=D - Modified end of fiber.
 
-       0000 - Landmark number or '9999' if not used.
+       0000 - Landmark number or '9999' if not used. None if not a number.
 
        yy=LS - Least-Square loss measurement technique.
        yy=2P - Two-point loss measurement technique.
@@ -197,15 +311,28 @@ def interpret_event_type(event_type):
         dict: Dictionary with interpretation of the event type.
     """
 
+    key = (event_type[:2], event_type[-2:])
+    try:
+        event, note, technique = _EVENT_TYPE_TABLE[key]
+    except KeyError:
+        event = EVENT_MAP.get(event_type[0])
+        note = EVENT_NOTE_MAP.get(event_type[1])
+        technique = LOSS_MEASUREMENT_MAP.get(event_type[-2:])
+
+    try:
+        landmark_number = int(event_type[2:6])
+    except ValueError:
+        landmark_number = None
+
     return {
-        "event": EVENT_MAP.get(event_type[0]),
-        "note": EVENT_NOTE_MAP.get(event_type[1]),  # I don't like this key
-        "landmark_number": int(event_type[2:6]),
-        "loss_measurement_technique": LOSS_MEASUREMENT_MAP.get(event_type[-2:]),
+        "event": event,
+        "note": note,  # I don't like this key
+        "landmark_number": landmark_number,
+        "loss_measurement_technique": technique,
     }
 
 
-def parse_map_block(fp):
+def parse_map_block(cur):
     """Parse the Map block.
 
     Below is an example of a dictionary this function may return.
@@ -231,43 +358,48 @@ def parse_map_block(fp):
      ```
     """
 
+    name = read_zero_terminated_string(cur)
+    version, numbytes, numblocks = read_struct(cur, _MAP_HEADER)
+
     data = {
-        "name": read_zero_terminated_string(fp),
-        "version": str(read_unsigned2(fp) / 100),
-        "numbytes": read_unsigned4(fp),
-        "numblocks": read_unsigned2(fp),
+        "name": name,
+        "version": str(version / 100),
+        "numbytes": numbytes,
+        "numblocks": numblocks,
         "maps": [],
     }
 
     for _ in range(1, data["numblocks"]):
+        name = read_zero_terminated_string(cur)
+        version, numbytes = read_struct(cur, _MAP_ENTRY)     # Some *.sor files only have 2 bytes left here and cannot be parsed!!!
         data["maps"].append(
             {
-                "name": read_zero_terminated_string(fp),
-                "version": str(read_unsigned2(fp) / 100),
-                "numbytes": read_unsigned4(fp),     # Some *.sor files only have 2 bytes left here and cannot be parsed!!!
+                "name": name,
+                "version": str(version / 100),
+                "numbytes": numbytes,
             }
         )
 
     return data
 
 
-def parse_genparams_block(fp):
+def parse_genparams_block(cur):
     """Parse a General parameters block."""
 
     data = {
-        "name": read_zero_terminated_string(fp),
-        "cable_id": read_zero_terminated_string(fp),
-        "fiber_id": read_zero_terminated_string(fp),
-        "fiber_type": read_unsigned2(fp),
-        "wavelength": read_unsigned2(fp),
-        "location_a": read_zero_terminated_string(fp),
-        "location_b": read_zero_terminated_string(fp),
-        "cable_code": read_zero_terminated_string(fp),
-        "build_condition": read_fixed_length_string(fp, 2),
-        "user_offset": read_unsigned4(fp),
-        "user_offset_distance": read_unsigned4(fp),
-        "operator": read_zero_terminated_string(fp),
-        "comments": read_zero_terminated_string(fp),
+        "name": read_zero_terminated_string(cur),
+        "cable_id": read_zero_terminated_string(cur),
+        "fiber_id": read_zero_terminated_string(cur),
+        "fiber_type": read_unsigned2(cur),
+        "wavelength": read_unsigned2(cur),
+        "location_a": read_zero_terminated_string(cur),
+        "location_b": read_zero_terminated_string(cur),
+        "cable_code": read_zero_terminated_string(cur),
+        "build_condition": read_fixed_length_string(cur, 2),
+        "user_offset": read_unsigned4(cur),
+        "user_offset_distance": read_unsigned4(cur),
+        "operator": read_zero_terminated_string(cur),
+        "comments": read_zero_terminated_string(cur),
     }
 
     data["fiber_type_description"] = FIBER_TYPES.get(data["fiber_type"])
@@ -276,24 +408,24 @@ def parse_genparams_block(fp):
     return data
 
 
-def parse_supparams_block(fp):
+def parse_supparams_block(cur):
     """Parse a Supplier parameters block."""
 
     data = {
-        "name": read_zero_terminated_string(fp),
-        "supplier_name": read_zero_terminated_string(fp),
-        "otdr_name": read_zero_terminated_string(fp),
-        "otdr_serial_number": read_zero_terminated_string(fp),
-        "module_name": read_zero_terminated_string(fp),
-        "module_serial_number": read_zero_terminated_string(fp),
-        "software_version": read_zero_terminated_string(fp),
-        "other": read_zero_terminated_string(fp),
+        "name": read_zero_terminated_string(cur),
+        "supplier_name": read_zero_terminated_string(cur),
+        "otdr_name": read_zero_terminated_string(cur),
+        "otdr_serial_number": read_zero_terminated_string(cur),
+        "module_name": read_zero_terminated_string(cur),
+        "module_serial_number": read_zero_terminated_string(cur),
+        "software_version": read_zero_terminated_string(cur),
+        "other": read_zero_terminated_string(cur),
     }
 
     return data
 
 
-def parse_fxdparams_block(fp):
+def parse_fxdparams_block(cur):
     """Parse a Fixed Parameters block.
 
     A limitation of this function is that only a single pulse width
@@ -303,35 +435,66 @@ def parse_fxdparams_block(fp):
 
     """
 
+    name = read_zero_terminated_string(cur)
+    (
+        date_time,
+        units,
+        wavelength,
+        acqusition_offset,
+        acqusition_offset_distance,
+        number_of_pulse_width_entries,
+        pulse_width,
+        sample_spacing,
+        number_of_data_points,
+        index_of_refraction,
+        backscattering_coefficient,
+        number_of_averages,
+        averaging_time,
+        range_,
+        acquisition_range_distance,
+        front_panel_offset,
+        noise_floor_level,
+        noise_floor_scaling_factor,
+        power_offset_first_point,
+        loss_threshold,
+        reflection_threshold,
+        end_of_transmission_threshold,
+        trace_type,
+        x1,
+        y1,
+        x2,
+        y2,
+    ) = read_struct(cur, _FXDPARAMS)
+
     data = {
-        "name": read_zero_terminated_string(fp),
-        "date_time": read_unsigned4(fp),
-        "units": read_fixed_length_string(fp, 2),
-        "wavelength": read_unsigned2(fp) / 10,
-        "acqusition_offset": read_signed4(fp),
-        "acqusition_offset_distance": read_signed4(fp),
-        "number_of_pulse_width_entries": read_unsigned2(fp),
-        "pulse_width": read_unsigned2(fp),
-        "sample_spacing": read_unsigned4(fp),
-        "number_of_data_points": read_unsigned4(fp),
-        "index_of_refraction": read_unsigned4(fp) / 100000,
-        "backscattering_coefficient": read_unsigned2(fp) * -0.1,
-        "number_of_averages": read_unsigned4(fp),
-        "averaging_time": read_unsigned2(fp),
-        "range": read_unsigned4(fp) * 2 * 10**5,
-        "acquisition_range_distance": read_signed4(fp),
-        "front_panel_offset": read_signed4(fp),
-        "noise_floor_level": read_unsigned2(fp),
-        "noise_floor_scaling_factor": read_signed2(fp),
-        "power_offset_first_point": read_unsigned2(fp),
-        "loss_threshold": read_unsigned2(fp) * 0.001,
-        "reflection_threshold": read_unsigned2(fp) * 0.001,
-        "end_of_transmission_threshold": read_unsigned2(fp) * -0.001,
-        "trace_type": read_fixed_length_string(fp, 2),
-        "x1": read_signed4(fp),
-        "y1": read_signed4(fp),
-        "x2": read_signed4(fp),
-        "y2": read_signed4(fp),
+        "name": name,
+        "date_time": date_time,
+        "units": decode_fixed_length_string(units),
+        "wavelength": wavelength / 10,
+        "acqusition_offset": acqusition_offset,
+        "acqusition_offset_distance": acqusition_offset_distance,
+        "number_of_pulse_width_entries": number_of_pulse_width_entries,
+        "pulse_width": pulse_width,
+        "sample_spacing": sample_spacing,
+        "number_of_data_points": number_of_data_points,
+        "index_of_refraction": index_of_refraction / 100000,
+        "backscattering_coefficient": backscattering_coefficient * -0.1,
+        "number_of_averages": number_of_averages,
+        "averaging_time": averaging_time,
+        "range": range_ * 2 * 10**5,
+        "acquisition_range_distance": acquisition_range_distance,
+        "front_panel_offset": front_panel_offset,
+        "noise_floor_level": noise_floor_level,
+        "noise_floor_scaling_factor": noise_floor_scaling_factor,
+        "power_offset_first_point": power_offset_first_point,
+        "loss_threshold": loss_threshold * 0.001,
+        "reflection_threshold": reflection_threshold * 0.001,
+        "end_of_transmission_threshold": end_of_transmission_threshold * -0.001,
+        "trace_type": decode_fixed_length_string(trace_type),
+        "x1": x1,
+        "y1": y1,
+        "x2": x2,
+        "y2": y2,
     }
 
     data["trace_type_description"] = TRACE_TYPES.get(data["trace_type"])
@@ -339,52 +502,109 @@ def parse_fxdparams_block(fp):
     return data
 
 
-def parse_datapts_block(fp, sample_spacing):
-    """Parse Data Points block."""
+def decode_data_points(raw, sample_spacing, scaling_factor):
+    """Decode the raw samples of a Data Points block.
+
+    Args:
+        raw (bytes): Samples as little-endian unsigned 16 bit integers.
+        sample_spacing (int): Sample spacing as found in the FxdParams block.
+        scaling_factor (int): Scaling factor as found in the DataPts block.
+
+    Returns:
+        list: (distance, power) pair of each data point.
+    """
+
+    # Decode all samples in one go rather than one per sample.
+    #
+    samples = array.array("H")
+    samples.frombytes(raw)
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    neg_sf = -scaling_factor
+    return [
+        (i * sample_spacing / 100000000 * C_M, sample * neg_sf / 1000000)
+        for i, sample in enumerate(samples)
+    ]
+
+
+def parse_datapts_block(cur, sample_spacing, decode=True):
+    """Parse Data Points block.
+
+    Args:
+        cur (Cursor): Read position within the SOR file.
+        sample_spacing (int): Sample spacing as found in the FxdParams block.
+        decode (bool): If false the samples are not decoded into
+            ``data_points`` but kept as bytes in ``raw_data_points``.
+    """
+
+    name = read_zero_terminated_string(cur)
+    (
+        number_of_data_points,
+        number_of_traces,
+        number_of_data_points2,
+        scaling_factor,
+    ) = read_struct(cur, _DATAPTS_HEADER)
 
     data = {
-        "name": read_zero_terminated_string(fp),
-        "number_of_data_points": read_unsigned4(fp),
-        "number_of_traces": read_unsigned2(fp),
-        "number_of_data_points2": read_unsigned4(fp),
-        "scaling_factor": read_unsigned2(fp),
-        "data_points": [],
+        "name": name,
+        "number_of_data_points": number_of_data_points,
+        "number_of_traces": number_of_traces,
+        "number_of_data_points2": number_of_data_points2,
+        "scaling_factor": scaling_factor,
     }
 
-    for n in range(0, data["number_of_data_points"]):
-        data["data_points"].append(
-            (
-                n * sample_spacing / 100000000 * C_M,
-                read_unsigned2(fp) * -data["scaling_factor"] / 1000000,
-            )
-        )
+    n = data["number_of_data_points"]
+    raw = cur.buf[cur.pos:cur.pos + 2 * n]
+    if len(raw) != 2 * n:
+        raise EOFError(f"Truncated data points at offset {cur.pos}")
+    cur.pos += 2 * n
+
+    if decode:
+        data["data_points"] = decode_data_points(raw, sample_spacing, scaling_factor)
+    else:
+        data["raw_data_points"] = raw
 
     return data
 
 
-def parse_keyevents_block(fp, index_of_refraction):
+def parse_keyevents_block(cur, index_of_refraction):
     """Parse Key Events block."""
 
     data = {
-        "name": read_zero_terminated_string(fp),
-        "number_of_events": read_unsigned2(fp),
+        "name": read_zero_terminated_string(cur),
+        "number_of_events": read_unsigned2(cur),
         "events": [],
     }
 
     for _ in range(0, data["number_of_events"]):
+        (
+            event_number,
+            time_of_travel,
+            slope,
+            splice_loss,
+            reflection_loss,
+            event_type,
+            end_of_previous_event,
+            beginning_of_current_event,
+            end_of_current_event,
+            beginning_of_next_event,
+            peak_point,
+        ) = read_struct(cur, _EVENT)
+
         event = {
-            "event_number": read_unsigned2(fp),
-            "time_of_travel": read_unsigned4(fp) * 0.1,
-            "slope": read_signed2(fp) * 0.001,
-            "splice_loss": read_signed2(fp) * 0.001,
-            "reflection_loss": read_signed4(fp) * 0.001,
-            "event_type": read_fixed_length_string(fp, 8),
-            "end_of_previous_event": read_unsigned4(fp),
-            "beginning_of_current_event": read_unsigned4(fp),
-            "end_of_current_event": read_unsigned4(fp),
-            "beginning_of_next_event": read_unsigned4(fp),
-            "peak_point": read_unsigned4(fp),
-            "comment": read_zero_terminated_string(fp),
+            "event_number": event_number,
+            "time_of_travel": time_of_travel * 0.1,
+            "slope": slope * 0.001,
+            "splice_loss": splice_loss * 0.001,
+            "reflection_loss": reflection_loss * 0.001,
+            "event_type": decode_fixed_length_string(event_type),
+            "end_of_previous_event": end_of_previous_event,
+            "beginning_of_current_event": beginning_of_current_event,
+            "end_of_current_event": end_of_current_event,
+            "beginning_of_next_event": beginning_of_next_event,
+            "peak_point": peak_point,
+            "comment": read_zero_terminated_string(cur),
         }
 
         event["distance_of_travel"] = (
@@ -395,83 +615,147 @@ def parse_keyevents_block(fp, index_of_refraction):
 
         data["events"].append(event)
 
+    (
+        total_loss,
+        fiber_start_position,
+        fiber_length,
+        optical_return_loss,
+        fiber_start_position2,
+        fiber_length2,
+    ) = read_struct(cur, _KEYEVENTS_SUMMARY)
+
     data.update(
         {
-            "total_loss": read_signed4(fp) * 0.001,
-            "fiber_start_position": read_signed4(fp),
-            "fiber_length": read_unsigned4(fp),
-            "optical_return_loss": read_unsigned2(fp) * 0.001,
-            "fiber_start_position2": read_signed4(fp),
-            "fiber_length2": read_unsigned4(fp),
+            "total_loss": total_loss * 0.001,
+            "fiber_start_position": fiber_start_position,
+            "fiber_length": fiber_length,
+            "optical_return_loss": optical_return_loss * 0.001,
+            "fiber_start_position2": fiber_start_position2,
+            "fiber_length2": fiber_length2,
         }
     )
 
     return data
 
 
-def parse_chksum_block(fp):
+def parse_chksum_block(cur):
     """Parse Chksum block."""
 
     return {
-        "name": read_zero_terminated_string(fp),
-        "chksum": f"{read_unsigned2(fp):04x}",
+        "name": read_zero_terminated_string(cur),
+        "chksum": f"{read_unsigned2(cur):04x}",
     }
 
 
-def parse_unknown_block(fp, n):
+def parse_unknown_block(cur, n):
     """Read an unknown block.
 
        Only the `name` is parsed and the rest of the block is returned
        as is.
 
     Args:
-        fp (file): File object of the opened SOR file.
+        cur (Cursor): Read position within the SOR file.
         n (int): The size of the block, including its name.
     """
 
-    name = read_zero_terminated_string(fp)
+    end = cur.pos + n
+    name = read_zero_terminated_string(cur)
+    content = cur.buf[cur.pos:end]
+    cur.pos = end
+
+    return {"name": name, "content": content}
+
+
+def _parse_fxdparams(cur, entry, ctx):
+    """Parse the FxdParams block and remember the values needed later."""
+
+    block = parse_fxdparams_block(cur)
+    ctx["sample_spacing"] = block["sample_spacing"]
+    ctx["index_of_refraction"] = block["index_of_refraction"]
+    return block
+
+
+def _parse_unknown(cur, entry, ctx):
+    """Parse a block for which there is no parser in ``_BLOCK_PARSERS``."""
+
+    return parse_unknown_block(cur, entry["numbytes"])
+
+
+# Block parsers by block name. The names are bytes, as returned by
+# read_zero_terminated_string(). Each is called with the cursor, the
+# block's entry in the Map block and the values remembered from
+# previously parsed blocks.
+#
+_BLOCK_PARSERS = {
+    b"GenParams": lambda cur, entry, ctx: parse_genparams_block(cur),
+    b"SupParams": lambda cur, entry, ctx: parse_supparams_block(cur),
+    b"FxdParams": _parse_fxdparams,
+    b"DataPts": lambda cur, entry, ctx: parse_datapts_block(
+        cur, ctx["sample_spacing"], ctx["data_points"]
+    ),
+    b"KeyEvents": lambda cur, entry, ctx: parse_keyevents_block(cur, ctx["index_of_refraction"]),
+    b"Cksum": lambda cur, entry, ctx: parse_chksum_block(cur),
+}
+
+
+def parse(fp, data_points=True):
+    """The ``parse()`` function is the public interface of this library.
+
+    Args:
+        fp (file): File object of the opened SOR file.
+        data_points (bool): Decoding the data points is by far the most
+            expensive part of parsing a file. Callers only interested in
+            the other blocks can pass ``False``, in which case the DataPts
+            block holds the undecoded samples as ``raw_data_points``
+            which can be passed to ``decode_data_points()`` later.
+
+    Returns:
+        list: The blocks contained in the file.
+    """
+
+    # Parse from a memory map of the file rather than through many small
+    # fp.read() calls. Anything that cannot be mapped, e.g. io.BytesIO,
+    # pipes or empty files, is read into memory with a single fp.read().
+    #
+    try:
+        buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        return _parse_blocks(Cursor(fp.read()), data_points)
 
-    return {"name": name, "content": fp.read(n - len(name) - 1)}
+    # Leave fp at the end of the file, like the fp.read() above does.
+    #
+    with buf:
+        blocks = _parse_blocks(Cursor(buf, fp.tell()), data_points)
+        fp.seek(len(buf))
+
+    return blocks
 
 
-def parse(fp):
-    """The ``parse()`` function is the public interface of this library."""
+def _parse_blocks(cur, data_points):
+    """Parse all blocks of a SOR file starting at ``cur``."""
 
     # The Map block is always the first block in the file.
     #
-    blocks = [parse_map_block(fp)]
+    blocks = [parse_map_block(cur)]
 
     # We need to remember some values for processing. They will
-    # be updated in the big if/elif/else block below but I list
+    # be updated when the FxdParams block is parsed but I list
     # them already here for clarity.
     #
-    # pulse_width = None
-    sample_spacing = None
-    index_of_refraction = None
+    ctx = {
+        "data_points": data_points,
+        "sample_spacing": None,
+        "index_of_refraction": None,
+    }
 
-    # Parse the other blocks.
+    # Parse the other blocks. Some vendors append proprietary fields to
+    # standard blocks, e.g. a 140 byte FxdParams block, so each block
+    # ends where its Map entry says, not where its parser stopped.
     #
     for entry in blocks[0]["maps"]:
-        block_name = entry["name"]
-
-        if block_name == "GenParams":
-            blocks += [parse_genparams_block(fp)]
-        elif block_name == "SupParams":
-            blocks += [parse_supparams_block(fp)]
-        elif block_name == "FxdParams":
-            blocks += [parse_fxdparams_block(fp)]
-            # pulse_width = blocks[-1]["pulse_width"]
-            sample_spacing = blocks[-1]["sample_spacing"]
-            index_of_refraction = blocks[-1]["index_of_refraction"]
-        elif block_name == "DataPts":
-            blocks += [parse_datapts_block(fp, sample_spacing)]
-        elif block_name == "KeyEvents":
-            blocks += [parse_keyevents_block(fp, index_of_refraction)]
-        elif block_name == "Cksum":
-            blocks += [parse_chksum_block(fp)]
-        else:
-            blocks += [parse_unknown_block(fp, entry["numbytes"])]
+        end = cur.pos + entry["numbytes"]
+        parser = _BLOCK_PARSERS.get(entry["name"], _parse_unknown)
+        blocks.append(parser(cur, entry, ctx))
+        cur.pos = end
 
     return blocks
-
-
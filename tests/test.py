@@ -1,8 +1,66 @@
 #!/usr/bin/env python3
 
+import io
 import sys
 sys.path.append('..')
 import otdrparser
 
+
+def find_block(blocks, name):
+    return next(block for block in blocks if block['name'] == name)
+
+
+with open(sys.argv[1], 'rb') as fp:
+    blocks = otdrparser.parse(fp)
+    assert fp.read() == b''
+
+with open(sys.argv[1], 'rb') as fp:
+    blocks_without_data_points = otdrparser.parse(fp, data_points=False)
+
+# Streams that cannot be memory-mapped are read into memory instead and
+# must give the same blocks. A truncated file must raise EOFError.
+#
 with open(sys.argv[1], 'rb') as fp:
-    otdrparser.parse(fp)
+    data = fp.read()
+
+assert otdrparser.parse(io.BytesIO(data)) == blocks
+
+try:
+    otdrparser.parse(io.BytesIO(data[:len(data) // 2]))
+except EOFError:
+    pass
+else:
+    raise AssertionError('truncated file parsed without EOFError')
+
+# Every block must be read with the size given by its Map entry, or
+# the following block names come out wrong (see the 140 byte FxdParams
+# block in otdr1.sor to otdr7.sor).
+#
+assert [block['name'] for block in blocks[1:]] == \
+    [entry['name'] for entry in blocks[0]['maps']]
+
+# Landmark numbers are parsed like int() does, anything else is None.
+#
+assert otdrparser.interpret_event_type('1F9999LS')['landmark_number'] == 9999
+assert otdrparser.interpret_event_type('1F  12LS')['landmark_number'] == 12
+assert otdrparser.interpret_event_type('1F12  LS')['landmark_number'] == 12
+assert otdrparser.interpret_event_type('1F+123LS')['landmark_number'] == 123
+assert otdrparser.interpret_event_type('1F²²²²LS')['landmark_number'] is None
+assert otdrparser.interpret_event_type('1FABCDLS')['landmark_number'] is None
+
+# The data points are decoded unless parse() is told not to, in which
+# case decode_data_points() must give the same result later.
+#
+fxdparams = find_block(blocks, b'FxdParams')
+datapts = find_block(blocks, b'DataPts')
+raw_datapts = find_block(blocks_without_data_points, b'DataPts')
+
+assert 'data_points' in datapts
+assert len(datapts['data_points']) == datapts['number_of_data_points']
+assert 'raw_data_points' in raw_datapts
+assert 'data_points' not in raw_datapts
+assert otdrparser.decode_data_points(
+    raw_datapts['raw_data_points'],
+    fxdparams['sample_spacing'],
+    raw_datapts['scaling_factor'],
+) == datapts['data_points']
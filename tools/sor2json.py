@@ -4,12 +4,20 @@
 
       $ sor2json.py mytrace.sor
 
+   The much faster 'orjson' library is used if it is installed.
+
 """
 
 import argparse
 import json
+import sys
 import otdrparser
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class BytesEncoder(json.JSONEncoder):
     """Custom JSON Encoder that can handle bytes."""
@@ -26,7 +34,18 @@ def main():
     args = parser.parse_args()
 
     with open(args.filename, "rb") as fp:
-        print(json.dumps(otdrparser.parse(fp), cls=BytesEncoder, indent=2))
+        blocks = otdrparser.parse(fp)
+
+    if orjson:
+        sys.stdout.buffer.write(
+            orjson.dumps(
+                blocks,
+                default=BytesEncoder().default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+            )
+        )
+    else:
+        print(json.dumps(blocks, cls=BytesEncoder, indent=2))
 
 
 if __name__ == "__main__":
@@ -7,9 +7,15 @@
 """
 
 import argparse
+import sys
 import yaml
 import otdrparser
 
+# Prefer the libyaml based dumper, which is much faster, if PyYAML was
+# built with it.
+#
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def main():
     parser = argparse.ArgumentParser(prog="sor2json")
@@ -17,7 +23,7 @@ def main():
     args = parser.parse_args()
 
     with open(args.filename, "rb") as fp:
-        print(yaml.dump(otdrparser.parse(fp)))
+        yaml.dump(otdrparser.parse(fp), sys.stdout, Dumper=Dumper)
 
 
 if __name__ == "__main__":